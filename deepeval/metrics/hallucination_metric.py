@@ -15,15 +15,11 @@ class HallucinationMetric(BaseMetric, metaclass=Singleton):
         if test_case.actual_output is None or test_case.context is None:
             raise ValueError("Output or context cannot be None")
 
-        context_list = []
-        for context in test_case.context:
-            context_list.append(context)
-
-        max_score = 0
-        for c in context_list:
-            score = Scorer.hallucination_score(c, test_case.actual_output)
-            if score > max_score:
-                max_score = score
+        scores = Scorer.hallucination_score_batch(
+            test_case.context,
+            [test_case.actual_output] * len(test_case.context),
+        )
+        max_score = max(scores, default=0)
 
         self.success = max_score > self.minimum_score
         self.score = max_score
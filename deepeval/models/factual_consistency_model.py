@@ -1,4 +1,6 @@
 import os
+import numpy as np
+from typing import List
 from deepeval.models.base import DeepEvalBaseModel
 from sentence_transformers import CrossEncoder
 from deepeval.utils import softmax
@@ -25,3 +27,23 @@ class FactualConsistencyModel(DeepEvalBaseModel):
         score = softmax_scores[0][1]
         second_score = softmax_scores[1][1]
         return max(score, second_score)
+
+    def predict_batch(self, texts_a: List[str], texts_b: List[str]):
+        """Scores every (text_a, text_b) pair in a single call to the model.
+
+        Args:
+            texts_a (List[str]): The first texts of the pairs.
+            texts_b (List[str]): The second texts of the pairs.
+
+        Returns:
+            A list with the factual consistency score of each pair.
+        """
+        pairs = list(zip(texts_a, texts_b))
+        if not pairs:
+            return []
+        # Each pair is scored in both directions, like in `_call`.
+        scores = self.model.predict(pairs + [(b, a) for a, b in pairs])
+        entailment_scores = softmax(scores)[:, 1]
+        return np.maximum(
+            entailment_scores[: len(pairs)], entailment_scores[len(pairs) :]
+        ).tolist()
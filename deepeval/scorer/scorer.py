@@ -1,9 +1,247 @@
-import torch
-from rouge_score import rouge_scorer
-from nltk.tokenize import word_tokenize
-from nltk.translate.bleu_score import sentence_bleu
-from typing import Union, List, Optional, Any
-from deepeval.utils import normalize_text
+import contextlib
+import functools
+import math
+import re
+import numpy as np
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Union, List, Optional, Any, Sequence, Tuple
+from deepeval.utils import batcher, normalize_text
+
+# torch and rouge_score are slow to import and only needed by some of the
+# scores, so they are imported where they are used.
+if TYPE_CHECKING:
+    import torch
+    from rouge_score import rouge_scorer
+
+
+@functools.lru_cache(maxsize=8)
+def _load_model(model_class: type, *args, **kwargs) -> Any:
+    """Builds ``model_class(*args, **kwargs)`` once and reuses it across calls.
+
+    Loading the underlying transformer dominates the cost of every model based
+    score, so the instances are kept around for as long as the process lives.
+    """
+    return model_class(*args, **kwargs)
+
+
+def _pick_device() -> str:
+    """Returns the best available torch device: CUDA, then Apple MPS, then CPU."""
+    import torch
+
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def _default_device() -> str:
+    """Returns the device the models that only know about CUDA load on."""
+    import torch
+
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+@contextlib.contextmanager
+def _inference_mode(device: str):
+    """Runs the enclosed forward passes without autograd tracking, and in half
+    precision when they happen on a CUDA device. MPS and CPU stay in fp32."""
+    import torch
+
+    with torch.inference_mode(), torch.autocast(
+        device_type="cuda",
+        dtype=torch.float16,
+        enabled=device.startswith("cuda"),
+    ):
+        yield
+
+
+# The same answer relevancy target is usually scored against many
+# predictions, so its embedding is kept, keyed on the model name as well as
+# the text, in a small LRU cache.
+_TARGET_EMBEDDINGS_MAXSIZE = 1024
+_target_embeddings: "OrderedDict[Tuple[Optional[str], str], torch.Tensor]" = (
+    OrderedDict()
+)
+
+
+def _get_target_embedding(
+    model_name: Optional[str], text: str
+) -> Optional["torch.Tensor"]:
+    key = (model_name, text)
+    embedding = _target_embeddings.get(key)
+    if embedding is not None:
+        _target_embeddings.move_to_end(key)
+    return embedding
+
+
+def _cache_target_embedding(
+    model_name: Optional[str], text: str, embedding: "torch.Tensor"
+):
+    _target_embeddings[(model_name, text)] = embedding
+    if len(_target_embeddings) > _TARGET_EMBEDDINGS_MAXSIZE:
+        _target_embeddings.popitem(last=False)
+
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+@functools.lru_cache(maxsize=10000)
+def _tokenize(text: str) -> Tuple[str, ...]:
+    """Splits text into word and punctuation tokens.
+
+    References are usually shared by many predictions, so the tokens are cached.
+    """
+    return tuple(_TOKEN_RE.findall(text))
+
+
+def _ngram_counts(tokens: Sequence[str], n: int) -> Counter:
+    # zip builds the n-gram tuples and Counter tallies them, both in C.
+    return Counter(zip(*(tokens[i:] for i in range(n))))
+
+
+@functools.lru_cache(maxsize=10000)
+def _max_reference_counts(
+    references: Tuple[Tuple[str, ...], ...], n: int
+) -> Counter:
+    """Returns the highest count of every n-gram across the references.
+
+    References are usually shared by many predictions, so the counts are
+    cached and must not be mutated.
+    """
+    max_counts = Counter()
+    for reference in references:
+        max_counts |= _ngram_counts(reference, n)
+    return max_counts
+
+
+def _modified_precision(
+    references: Tuple[Tuple[str, ...], ...], hypothesis: Sequence[str], n: int
+) -> Tuple[int, int]:
+    """Returns the clipped n-gram matches of the hypothesis and its n-gram count."""
+    counts = _ngram_counts(hypothesis, n)
+    max_reference_counts = _max_reference_counts(references, n)
+    matches = sum(
+        min(count, max_reference_counts[ngram])
+        for ngram, count in counts.items()
+    )
+    return matches, max(1, len(hypothesis) - n + 1)
+
+
+def _brevity_penalty(reference_length: int, hypothesis_length: int) -> float:
+    if hypothesis_length > reference_length:
+        return 1.0
+    if hypothesis_length == 0:
+        return 0.0
+    return math.exp(1 - reference_length / hypothesis_length)
+
+
+def _closest_reference_length(
+    references: Tuple[Tuple[str, ...], ...], hypothesis_length: int
+) -> int:
+    return min(
+        (len(reference) for reference in references),
+        key=lambda length: (abs(length - hypothesis_length), length),
+    )
+
+
+def _corpus_bleu(
+    list_of_references: List[Tuple[Tuple[str, ...], ...]],
+    hypotheses: List[Sequence[str]],
+    weights: Tuple[float, ...],
+) -> float:
+    """Computes BLEU the way `nltk.translate.bleu_score.corpus_bleu` does
+    without smoothing, but only for the n-gram orders that carry a weight.
+
+    Matches and n-gram counts are summed over the whole corpus before the
+    precisions are taken, so a single hypothesis gives its sentence BLEU.
+    """
+    assert len(list_of_references) == len(
+        hypotheses
+    ), "The number of hypotheses and their reference(s) should be the same"
+    log_precision = 0.0
+    for n, weight in enumerate(weights, start=1):
+        if not weight:
+            continue
+        matches, total = 0, 0
+        for references, hypothesis in zip(list_of_references, hypotheses):
+            sentence_matches, sentence_total = _modified_precision(
+                references, hypothesis, n
+            )
+            matches += sentence_matches
+            total += sentence_total
+        if matches == 0:
+            return 0.0
+        log_precision += weight * math.log(matches / total)
+    hypotheses_length = sum(len(hypothesis) for hypothesis in hypotheses)
+    references_length = sum(
+        _closest_reference_length(references, len(hypothesis))
+        for references, hypothesis in zip(list_of_references, hypotheses)
+    )
+    brevity_penalty = _brevity_penalty(references_length, hypotheses_length)
+    return brevity_penalty * math.exp(log_precision)
+
+
+_BLEU_WEIGHT_MAP = {
+    "bleu1": (1, 0, 0, 0),
+    "bleu2": (0, 1, 0, 0),
+    "bleu3": (0, 0, 1, 0),
+    "bleu4": (0, 0, 0, 1),
+}
+
+
+# Targets are compared against many predictions, so normalized texts are cached.
+_normalize_text = functools.lru_cache(maxsize=10000)(normalize_text)
+
+
+def _match_arrays(
+    targets: Union[List[str], np.ndarray],
+    predictions: Union[List[Optional[str]], np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Object arrays keep the strings as they are: fixed width str arrays
+    # would drop trailing NUL characters before comparing.
+    targets = np.asarray(targets, dtype=object)
+    predictions = np.asarray(predictions, dtype=object)
+    # Like the per-pair scores, empty and None predictions never match.
+    present = predictions.astype(bool)
+    predictions = np.where(present, predictions, "")
+    return targets, predictions, present
+
+
+class _RougeTokenizer:
+    """The default rouge tokenizer with a memoized Porter stemmer.
+
+    The same words come up across targets and predictions, and stemming is the
+    most expensive part of tokenizing them.
+    """
+
+    def __init__(self):
+        from nltk.stem import porter
+        from rouge_score import tokenize
+
+        self._tokenize = tokenize.tokenize
+        self._stemmer = porter.PorterStemmer()
+        self._stemmer.stem = functools.lru_cache(maxsize=100000)(
+            self._stemmer.stem
+        )
+
+    def tokenize(self, text: str) -> List[str]:
+        return self._tokenize(text, self._stemmer)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_rouge_tokenizer() -> _RougeTokenizer:
+    return _RougeTokenizer()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_rouge_scorer(score_type: str) -> "rouge_scorer.RougeScorer":
+    from rouge_score import rouge_scorer
+
+    return rouge_scorer.RougeScorer(
+        [score_type], tokenizer=_get_rouge_tokenizer()
+    )
 
 
 # TODO: More scores are to be added
@@ -36,10 +274,38 @@ class Scorer:
             "rouge2",
             "rougeL",
         ], "score_type can be either rouge1, rouge2 or rougeL"
-        scorer = rouge_scorer.RougeScorer([score_type], use_stemmer=True)
+        scorer = _get_rouge_scorer(score_type)
         scores = scorer.score(target, prediction)
         return scores[score_type].fmeasure
 
+    @classmethod
+    def rouge_score_batch(
+        cls, targets: List[str], predictions: List[str], score_type: str
+    ) -> List[float]:
+        """Calculates the Rouge score of each prediction against its target.
+
+        Args:
+            targets (List[str]): The actual labels or target texts.
+            predictions (List[str]): The generated texts from the model or LLM, one per target.
+            score_type (str): The Rouge score type (Options: 'rouge1', 'rouge2', 'rougeL').
+
+        Returns:
+            List[float]: The Rouge score of every (target, prediction) pair, based on the specified score type.
+        """
+        assert score_type in [
+            "rouge1",
+            "rouge2",
+            "rougeL",
+        ], "score_type can be either rouge1, rouge2 or rougeL"
+        assert len(targets) == len(
+            predictions
+        ), "targets and predictions should have the same length"
+        scorer = _get_rouge_scorer(score_type)
+        return [
+            scorer.score(target, prediction)[score_type].fmeasure
+            for target, prediction in zip(targets, predictions)
+        ]
+
     @classmethod
     def sentence_bleu_score(
         cls,
@@ -60,25 +326,56 @@ class Scorer:
         Returns:
             float: The BLEU score for the given prediction and references.
         """
-        assert bleu_type in [
-            "bleu1",
-            "bleu2",
-            "bleu3",
-            "bleu4",
-        ], "Invalud bleu_type. Options: 'bleu1', 'bleu2', 'bleu3', 'bleu4'"
+        assert (
+            bleu_type in _BLEU_WEIGHT_MAP
+        ), "Invalud bleu_type. Options: 'bleu1', 'bleu2', 'bleu3', 'bleu4'"
         targets = [references] if isinstance(references, str) else references
-        tokenized_targets = [word_tokenize(target) for target in targets]
-        tokenized_prediction = word_tokenize(prediction)
-        bleu_weight_map = {
-            "bleu1": (1, 0, 0, 0),
-            "bleu2": (0, 1, 0, 0),
-            "bleu3": (0, 0, 1, 0),
-            "bleu4": (0, 0, 0, 1),
-        }
-        return sentence_bleu(
+        tokenized_targets = tuple(_tokenize(target) for target in targets)
+        tokenized_prediction = _tokenize(prediction)
+        return _corpus_bleu(
+            [tokenized_targets],
+            [tokenized_prediction],
+            weights=_BLEU_WEIGHT_MAP[bleu_type],
+        )
+
+    @classmethod
+    def bleu_score_corpus(
+        cls,
+        list_of_references: List[Union[str, List[str]]],
+        predictions: List[str],
+        bleu_type: Optional[str] = "bleu1",
+    ) -> float:
+        """Calculates the corpus level BLEU score of a list of predictions, each compared to its reference sentence(s).
+
+        Unlike averaging `sentence_bleu_score` over the predictions, the n-gram matches and lengths are summed over the whole corpus
+        before the score is computed, which is the standard way of reporting BLEU for a dataset.
+
+        Args:
+            list_of_references (List[Union[str, List[str]]]): A reference sentence or a list of reference sentences for each prediction.
+            predictions (List[str]): The generated texts or sentences to be evaluated.
+            bleu_type (Optional[str]): The BLEU score type (Options: 'bleu1', 'bleu2', 'bleu3', 'bleu4'). Default is 'bleu1'.
+
+        Returns:
+            float: The BLEU score of the predictions against their references.
+        """
+        assert (
+            bleu_type in _BLEU_WEIGHT_MAP
+        ), "Invalud bleu_type. Options: 'bleu1', 'bleu2', 'bleu3', 'bleu4'"
+        tokenized_targets = [
+            (
+                (_tokenize(targets),)
+                if isinstance(targets, str)
+                else tuple(_tokenize(target) for target in targets)
+            )
+            for targets in list_of_references
+        ]
+        tokenized_predictions = [
+            _tokenize(prediction) for prediction in predictions
+        ]
+        return _corpus_bleu(
             tokenized_targets,
-            tokenized_prediction,
-            weights=bleu_weight_map[bleu_type],
+            tokenized_predictions,
+            weights=_BLEU_WEIGHT_MAP[bleu_type],
         )
 
     @classmethod
@@ -100,32 +397,88 @@ class Scorer:
     def quasi_exact_match_score(cls, target: str, prediction: str) -> int:
         if not prediction:
             return 0
-        return 1 if normalize_text(target) == normalize_text(prediction) else 0
+        return (
+            1 if _normalize_text(target) == _normalize_text(prediction) else 0
+        )
+
+    @classmethod
+    def exact_match_batch(
+        cls,
+        targets: Union[List[str], np.ndarray],
+        predictions: Union[List[Optional[str]], np.ndarray],
+    ) -> np.ndarray:
+        """Calculates the exact match score of every prediction against its target.
+
+        The pairs are compared as whole arrays, but stripping the strings still takes one Python call per element.
+
+        Args:
+            targets (Union[List[str], np.ndarray]): The target strings.
+            predictions (Union[List[Optional[str]], np.ndarray]): The predicted strings from the llm, one per target. Empty or None predictions score 0.
+
+        Returns:
+            np.ndarray: The exact match score (0 or 1) of each pair, as int8.
+        """
+        assert len(targets) == len(
+            predictions
+        ), "targets and predictions should have the same length"
+        targets, predictions, present = _match_arrays(targets, predictions)
+        strip = np.vectorize(str.strip, otypes=[object])
+        matches = present & (strip(targets) == strip(predictions))
+        return matches.astype(np.int8)
+
+    @classmethod
+    def quasi_exact_match_batch(
+        cls,
+        targets: Union[List[str], np.ndarray],
+        predictions: Union[List[Optional[str]], np.ndarray],
+    ) -> np.ndarray:
+        """Calculates the quasi exact match score of every prediction against its target.
+
+        The pairs are compared as whole arrays, but normalizing the strings still takes one Python call per element.
+
+        Args:
+            targets (Union[List[str], np.ndarray]): The target strings.
+            predictions (Union[List[Optional[str]], np.ndarray]): The predicted strings from the llm, one per target. Empty or None predictions score 0.
+
+        Returns:
+            np.ndarray: The quasi exact match score (0 or 1) of each pair, as int8.
+        """
+        assert len(targets) == len(
+            predictions
+        ), "targets and predictions should have the same length"
+        targets, predictions, present = _match_arrays(targets, predictions)
+        normalize = np.vectorize(_normalize_text, otypes=[object])
+        matches = present & (normalize(targets) == normalize(predictions))
+        return matches.astype(np.int8)
 
     # Todo: More mode based metrics to be added
 
     @classmethod
     def bert_score(
         cls,
-        references: Union[str, List[str]],
+        references: Union[str, List[str], List[List[str]]],
         predictions: Union[str, List[str]],
         model: Optional[str] = "microsoft/deberta-large-mnli",
         lang: Optional[str] = "en",
-    ) -> float:
+        batch_size: Optional[int] = 64,
+    ) -> dict:
         """
-        Calculate BERTScore for one or more reference sentences compared to one or more prediction sentences using a specified BERT model.
+        Calculate BERTScore for a batch of prediction sentences compared to their reference sentences using a specified BERT model.
+
+        All the predictions are scored together, so callers evaluating a dataset should pass every pair at once instead of calling this per pair.
 
         Args:
-            references (Union[str, List[str]]): A single reference sentence or a list of reference sentences.
+            references (Union[str, List[str], List[List[str]]]): One reference (or a list of references) per prediction. If a single reference or a flat list whose length differs from `predictions` is given, it is used as the set of references for every prediction.
             predictions (Union[str, List[str]]): A single prediction sentence or a list of prediction sentences.
             model (Optional[str], optional): The name of the BERT model to be used for scoring. Defaults to "microsoft/deberta-large-mnli".
             lang (Optional[str], optional): The language code of the text, e.g., "en" for English. Defaults to "en".
+            batch_size (Optional[int], optional): The number of sentences per forward pass of the model. Defaults to 64.
 
         Returns:
-            Dict[str, float]: A dictionary containing BERTScore metrics including precision, recall, and F1 score.
-                - 'bert-precision' (float): BERTScore precision.
-                - 'bert-recall' (float): BERTScore recall.
-                - 'bert-f1' (float): BERTScore F1 score.
+            Dict[str, List[float]]: A dictionary containing BERTScore metrics including precision, recall, and F1 score, one value per prediction.
+                - 'bert-precision' (List[float]): BERTScore precision.
+                - 'bert-recall' (List[float]): BERTScore recall.
+                - 'bert-f1' (List[float]): BERTScore F1 score.
 
         Note:
             Before using this function, make sure to install the 'bert_score' module by running the following command:
@@ -133,6 +486,15 @@ class Scorer:
             pip install bert-score
             ```
         """
+        if isinstance(predictions, str):
+            predictions = [predictions]
+
+        if isinstance(references, str):
+            references = [references]
+
+        if not predictions or not references:
+            return {"bert-precision": [], "bert-recall": [], "bert-f1": []}
+
         try:
             from bert_score import BERTScorer
         except ModuleNotFoundError as e:
@@ -140,37 +502,100 @@ class Scorer:
                 "Please install bert_score module. Command: pip install bert-score"
             )
 
-        # FIXME: Fix the case for mps
-        device = "cuda" if torch.cuda.is_available() else "cpu"
-        bert_scorer = BERTScorer(
+        import torch
+
+        device = _pick_device()
+        bert_scorer = _load_model(
+            BERTScorer,
             model_type=model,
             lang=lang,
             rescale_with_baseline=True,
             device=device,
         )
 
-        if isinstance(predictions, str):
-            predictions = [predictions]
+        if len(predictions) != len(references) and isinstance(
+            references[0], str
+        ):
+            references = [references] * len(predictions)
+        assert len(predictions) == len(
+            references
+        ), "There should be one list of references per prediction"
+
+        # Repeated pairs are only scored once and scattered back afterwards.
+        pairs = [
+            (
+                prediction,
+                reference if isinstance(reference, str) else tuple(reference),
+            )
+            for prediction, reference in zip(predictions, references)
+        ]
+        unique_pairs = list(dict.fromkeys(pairs))
+        pair_index = {pair: index for index, pair in enumerate(unique_pairs)}
+        inverse = torch.tensor([pair_index[pair] for pair in pairs])
+
+        candidates = [prediction for prediction, _ in unique_pairs]
+        references = [
+            reference if isinstance(reference, str) else list(reference)
+            for _, reference in unique_pairs
+        ]
+
+        def score_pairs(start: int, end: int) -> "torch.Tensor":
+            # Inference mode and autocast are thread local.
+            with _inference_mode(device):
+                precision, recall, f1 = bert_scorer.score(
+                    cands=candidates[start:end],
+                    refs=references[start:end],
+                    batch_size=batch_size,
+                )
+            # The three scores leave the device in a single (3, N) transfer,
+            # and are reduced in fp32 whatever precision the model ran in.
+            return torch.stack([precision, recall, f1]).detach().cpu().float()
+
+        # BERTScorer tokenizes each batch on the CPU and waits for the GPU
+        # before moving to the next one. On CUDA, scoring chunks from two
+        # threads lets one chunk be tokenized while the other one runs.
+        # Elsewhere a single call keeps BERTScorer's corpus wide dedup and
+        # length sorting.
+        chunk_size = batch_size * 4
+        if device.startswith("cuda") and len(candidates) > chunk_size:
+            starts = range(0, len(candidates), chunk_size)
+            ends = [start + chunk_size for start in starts]
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                chunk_scores = list(executor.map(score_pairs, starts, ends))
+            scores = torch.cat(chunk_scores, dim=1)
+        else:
+            scores = score_pairs(0, len(candidates))
+        precision, recall, f1 = scores[:, inverse].tolist()
+        return {
+            "bert-precision": precision,
+            "bert-recall": recall,
+            "bert-f1": f1,
+        }
 
-        if isinstance(references, str):
-            references = [references]
+    @classmethod
+    def bert_score_one(
+        cls,
+        reference: Union[str, List[str]],
+        prediction: str,
+        model: Optional[str] = "microsoft/deberta-large-mnli",
+        lang: Optional[str] = "en",
+    ) -> dict:
+        """Calculate BERTScore for a single prediction against a reference sentence or a list of reference sentences.
 
-        if (
-            isinstance(predictions, list)
-            and isinstance(references, list)
-            and not isinstance(references[0], list)
-        ):
-            if len(predictions) != len(references):
-                references = [references]
+        Args:
+            reference (Union[str, List[str]]): A reference sentence or a list of reference sentences.
+            prediction (str): The prediction sentence.
+            model (Optional[str], optional): The name of the BERT model to be used for scoring. Defaults to "microsoft/deberta-large-mnli".
+            lang (Optional[str], optional): The language code of the text, e.g., "en" for English. Defaults to "en".
 
-        precision, recall, f1 = bert_scorer.score(
-            cands=predictions, refs=references
+        Returns:
+            Dict[str, float]: A dictionary with the 'bert-precision', 'bert-recall' and 'bert-f1' of the prediction.
+        """
+        references = [reference] if isinstance(reference, str) else reference
+        scores = cls.bert_score(
+            [references], [prediction], model=model, lang=lang
         )
-        return {
-            "bert-precision": precision.detach().numpy().tolist(),
-            "bert-recall": recall.detach().numpy().tolist(),
-            "bert-f1": f1.detach().numpy().tolist(),
-        }
+        return {key: values[0] for key, values in scores.items()}
 
     @classmethod
     def faithfulness_score(
@@ -201,10 +626,14 @@ class Scorer:
         except Exception as e:
             print(f"SummaCZS model can not be loaded.\n{e}")
 
-        scorer = SummaCModels(
-            model_name=model, granularity=granularity, device=device
+        scorer = _load_model(
+            SummaCModels,
+            model_name=model,
+            granularity=granularity,
+            device=device,
         )
-        return scorer(target, prediction)["score"]
+        with _inference_mode(scorer.device):
+            return scorer(target, prediction)["score"]
 
     @classmethod
     def hallucination_score(
@@ -231,7 +660,50 @@ class Scorer:
                 f"Vectera Hallucination detection model can not be loaded.\n{e}"
             )
         scorer = HallucinationModel(model_name=model)
-        return scorer.model.predict([source, prediction])
+        device = _default_device()
+        with _inference_mode(device):
+            return scorer.model.predict([source, prediction])
+
+    @classmethod
+    def hallucination_score_batch(
+        cls,
+        sources: List[str],
+        predictions: List[str],
+        model: Optional[str] = None,
+        batch_size: Optional[int] = 32,
+    ) -> List[float]:
+        """Calculate the hallucination score of each prediction compared to its source text.
+
+        All the (source, prediction) pairs go through the Vectara Hallucination Evaluation Model together, in batches of `batch_size`.
+
+        Args:
+            sources (List[str]): The source documents where the information is summarized from.
+            predictions (List[str]): The generated summaries, one per source.
+            batch_size (Optional[int], optional): The number of pairs per forward pass of the model. Defaults to 32.
+
+        Returns:
+            List[float]: The hallucination score of each prediction. Lower values indicate greater hallucination.
+        """
+        try:
+            from deepeval.models.hallucination_model import (
+                HallucinationModel,
+            )
+        except ImportError as e:
+            print(
+                f"Vectera Hallucination detection model can not be loaded.\n{e}"
+            )
+        assert len(sources) == len(
+            predictions
+        ), "sources and predictions should have the same length"
+        if not sources:
+            return []
+        scorer = HallucinationModel(model_name=model)
+        device = _default_device()
+        with _inference_mode(device):
+            scores = scorer.model.predict(
+                list(zip(sources, predictions)), batch_size=batch_size
+            )
+        return scores.tolist()
 
     @classmethod
     def PII_score(
@@ -275,8 +747,10 @@ class Scorer:
             from deepeval.models import DetoxifyModel
         except ImportError as e:
             print(f"Unable to import.\n {e}")
-        scorer = DetoxifyModel(model_name=model)
-        return scorer(prediction)
+        scorer = _load_model(DetoxifyModel, model_name=model)
+        device = _default_device()
+        with _inference_mode(device):
+            return scorer(prediction)
 
     @classmethod
     def answer_relevancy_score(
@@ -297,6 +771,7 @@ class Scorer:
         Returns:
             float: Answer relevancy score.
         """
+        import torch
         from sentence_transformers import util
 
         try:
@@ -319,17 +794,28 @@ class Scorer:
             assert isinstance(
                 predictions, str
             ), "When model_type is 'cross_encoder', you can compare with one prediction and one target."
-            answer_relevancy_model = CrossEncoderAnswerRelevancyModel(
-                model_name=model_name
+            answer_relevancy_model = _load_model(
+                CrossEncoderAnswerRelevancyModel, model_name=model_name
             )
             score = answer_relevancy_model(predictions, target)
         else:
-            answer_relevancy_model = AnswerRelevancyModel(model_name=model_name)
+            answer_relevancy_model = _load_model(
+                AnswerRelevancyModel, model_name=model_name
+            )
             docs = (
                 [predictions] if isinstance(predictions, str) else predictions
             )
-            query_embedding = answer_relevancy_model(target)
-            document_embedding = answer_relevancy_model(docs)
+            query_embedding = _get_target_embedding(model_name, target)
+            if query_embedding is None:
+                # A single encode call lets SentenceTransformer sort the query
+                # and the documents by length together, so batches carry less
+                # padding.
+                embeddings = answer_relevancy_model([target, *docs])
+                query_embedding = torch.from_numpy(embeddings[0].copy())
+                document_embedding = embeddings[1:]
+                _cache_target_embedding(model_name, target, query_embedding)
+            else:
+                document_embedding = answer_relevancy_model(docs)
             scores = (
                 util.dot_score(query_embedding, document_embedding)[0]
                 .cpu()
@@ -344,18 +830,55 @@ class Scorer:
         contexts: Union[List[str], str],
         prediction: str,
         model: Optional[str] = None,
+        batch_size: Optional[int] = 32,
+        early_stop_threshold: Optional[float] = None,
     ) -> float:
+        """Calculates how consistent a prediction is with the best supporting context.
+
+        Contexts are scored in batches. If `early_stop_threshold` is given, the contexts sharing the most words with the prediction
+        are scored first, and scoring stops as soon as one context reaches the threshold.
+
+        Args:
+            contexts (Union[List[str], str]): The context or contexts the prediction should be consistent with.
+            prediction (str): The generated text to be evaluated.
+            model (Optional[str], optional): The name of the cross encoder model. Defaults to None.
+            batch_size (Optional[int], optional): The number of contexts scored per call to the model. Defaults to 32.
+            early_stop_threshold (Optional[float], optional): The score past which the remaining contexts are not scored, e.g. 0.99. Defaults to None, which scores every context.
+
+        Returns:
+            float: The highest factual consistency score among the scored contexts, which is the highest over all contexts unless scoring stopped early.
+        """
         try:
             from deepeval.models import FactualConsistencyModel
         except Exception as e:
             print(f"Unable to load FactualConsistencyModel\n{e}")
 
-        scorer = FactualConsistencyModel(model)
+        scorer = _load_model(FactualConsistencyModel, model)
         contexts = [contexts] if isinstance(contexts, str) else contexts
+        # Only the best context matters, so duplicates need not be scored.
+        contexts = list(dict.fromkeys(contexts))
+        if early_stop_threshold is not None:
+            # Word overlap is a cheap proxy for support, so the likeliest
+            # contexts come first and scoring stops as soon as possible.
+            prediction_words = set(_TOKEN_RE.findall(prediction.lower()))
+            contexts.sort(
+                key=lambda context: len(
+                    prediction_words.intersection(
+                        _TOKEN_RE.findall(context.lower())
+                    )
+                ),
+                reverse=True,
+            )
+
         max_score = 0
-        for context in contexts:
-            score = scorer.predict(context, prediction)
-            max_score = max(max_score, score)
+        for batch in batcher(contexts, batch_size=batch_size):
+            scores = scorer.predict_batch(batch, [prediction] * len(batch))
+            max_score = max(max_score, *scores)
+            if (
+                early_stop_threshold is not None
+                and max_score >= early_stop_threshold
+            ):
+                break
         return max_score
 
     @classmethod
@@ -364,5 +887,5 @@ class Scorer:
             from deepeval.models import UnBiasedModel
         except Exception as e:
             print(f"Unable to load UnBiasedModel.\n{e}")
-        scorer = UnBiasedModel(model_name=model)
+        scorer = _load_model(UnBiasedModel, model_name=model)
         return scorer(text)
@@ -54,25 +54,16 @@ def chunk_text(text, chunk_size=20):
     return chunks
 
 
+_ARTICLES_RE = re.compile(r"\b(a|an|the)\b")
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+
 def normalize_text(text: str) -> str:
     """Lower text and remove punctuation, articles and extra whitespace.
     Copied from the [QuAC](http://quac.ai/) evaluation script found at
     https://s3.amazonaws.com/my89public/quac/scorer.py"""
-
-    def remove_articles(text: str) -> str:
-        return re.sub(r"\b(a|an|the)\b", " ", text)
-
-    def white_space_fix(text: str) -> str:
-        return " ".join(text.split())
-
-    def remove_punc(text: str) -> str:
-        exclude = set(string.punctuation)
-        return "".join(ch for ch in text if ch not in exclude)
-
-    def lower(text: str) -> str:
-        return text.lower()
-
-    return white_space_fix(remove_articles(remove_punc(lower(text))))
+    text = text.lower().translate(_PUNCTUATION_TABLE)
+    return " ".join(_ARTICLES_RE.sub(" ", text).split())
 
 
 ###############################################
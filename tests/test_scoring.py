@@ -1,10 +1,70 @@
 """Tests for metrics calculator
 """
 
+import contextlib
+import random
+import sys
+import types
 import unittest
+import warnings
+from unittest import mock
 from deepeval.scorer import Scorer
 
 
+class StubBERTScorer:
+    """Stands in for bert_score.BERTScorer, scoring a pair by its lengths."""
+
+    calls = []
+
+    def __init__(self, **kwargs):
+        pass
+
+    def score(self, cands, refs, batch_size=64):
+        import torch
+
+        StubBERTScorer.calls.append(len(cands))
+        scores = torch.tensor(
+            [stub_bert_score(cand, ref) for cand, ref in zip(cands, refs)]
+        )
+        return scores, scores * 2, scores * 3
+
+
+def patch_bert_score_module():
+    # torch is imported up front: patching sys.modules drops every module
+    # first imported while the patch is active.
+    import torch
+
+    stub_module = types.ModuleType("bert_score")
+    stub_module.BERTScorer = StubBERTScorer
+    return mock.patch.dict(sys.modules, {"bert_score": stub_module})
+
+
+def stub_bert_score(prediction, references):
+    if isinstance(references, str):
+        references = [references]
+    return float(len(prediction) + sum(map(len, references)))
+
+
+class StubFactualConsistencyModel:
+    """Stands in for FactualConsistencyModel, reading a context's score from
+    its first word."""
+
+    calls = []
+
+    def __init__(self, model_name=None):
+        pass
+
+    def predict_batch(self, texts_a, texts_b):
+        StubFactualConsistencyModel.calls.append(list(texts_a))
+        return [float(text.split()[0]) for text in texts_a]
+
+
+def patch_deepeval_models_module():
+    stub_module = types.ModuleType("deepeval.models")
+    stub_module.FactualConsistencyModel = StubFactualConsistencyModel
+    return mock.patch.dict(sys.modules, {"deepeval.models": stub_module})
+
+
 class TestScorer(unittest.TestCase):
     # tests for exact_match_score
 
@@ -55,6 +115,49 @@ class TestScorer(unittest.TestCase):
         prediction = ""
         self.assertEqual(Scorer.quasi_exact_match_score(target, prediction), 0)
 
+    # tests for the batched exact match scores
+
+    def test_exact_match_batch(self):
+        targets = ["Hello, World!", "Hello, World!", "Hello, World!", ""]
+        predictions = [" Hello, World! ", "Goodbye, World!", "", "Hello"]
+        scores = Scorer.exact_match_batch(targets, predictions)
+        self.assertEqual(scores.tolist(), [1, 0, 0, 0])
+
+    def test_exact_match_batch_matches_exact_match_score(self):
+        targets = ["ab", "ab", "", "ab\x00"]
+        predictions = ["ab\x00", " ab\n", "", "ab\x00"]
+        scores = Scorer.exact_match_batch(targets, predictions)
+        self.assertEqual(
+            scores.tolist(),
+            [
+                Scorer.exact_match_score(target, prediction)
+                for target, prediction in zip(targets, predictions)
+            ],
+        )
+
+    def test_quasi_exact_match_batch(self):
+        targets = ["The quick brown fox", "The quick brown fox", "The fox"]
+        predictions = ["the quick brown fox", "The brown fox", ""]
+        scores = Scorer.quasi_exact_match_batch(targets, predictions)
+        self.assertEqual(scores.tolist(), [1, 0, 0])
+
+    def test_exact_match_batch_none_prediction(self):
+        targets = ["Hello, World!", "The quick brown fox"]
+        predictions = [None, "the quick brown fox"]
+        self.assertEqual(
+            Scorer.exact_match_batch(targets, predictions).tolist(), [0, 0]
+        )
+        self.assertEqual(
+            Scorer.quasi_exact_match_batch(targets, predictions).tolist(),
+            [0, 1],
+        )
+
+    def test_exact_match_batch_length_mismatch(self):
+        with self.assertRaises(AssertionError):
+            Scorer.exact_match_batch(["a", "b", "c"], ["a"])
+        with self.assertRaises(AssertionError):
+            Scorer.quasi_exact_match_batch(["a", "b", "c"], ["a"])
+
     # Testing for rouge score 1/2/L
 
     def test_rouge_score_rouge1(self):
@@ -78,6 +181,38 @@ class TestScorer(unittest.TestCase):
         rouge_score = Scorer.rouge_score(target, prediction, score_type)
         self.assertAlmostEqual(rouge_score, 1.0, places=2)
 
+    def test_rouge_score_batch(self):
+        from rouge_score import rouge_scorer
+
+        # Compared with a stock RougeScorer, so a regression in the cached
+        # tokenizer or stemmer shows up.
+        targets = [
+            "The quick brown fox",
+            "The quick brown fox",
+            "Running runners ran quickly to the running race",
+            "",
+        ]
+        predictions = [
+            "The quick brown fox",
+            "The lazy dog",
+            "The runner runs quick races, running!",
+            "The lazy dog",
+        ]
+        for score_type in ["rouge1", "rouge2", "rougeL"]:
+            scorer = rouge_scorer.RougeScorer([score_type], use_stemmer=True)
+            rouge_scores = Scorer.rouge_score_batch(
+                targets, predictions, score_type
+            )
+            self.assertEqual(len(rouge_scores), len(targets))
+            for target, prediction, rouge_score in zip(
+                targets, predictions, rouge_scores
+            ):
+                self.assertAlmostEqual(
+                    rouge_score,
+                    scorer.score(target, prediction)[score_type].fmeasure,
+                    places=6,
+                )
+
     # Testing sentence BLEU score 1/4
 
     def test_sentence_bleu_score_bleu1(self):
@@ -98,6 +233,125 @@ class TestScorer(unittest.TestCase):
         )
         self.assertAlmostEqual(bleu_score, 1.0, places=2)
 
+    def test_bleu_score_corpus(self):
+        list_of_references = [
+            "The quick brown fox jumps over the lazy dog",
+            ["The lazy dog sleeps", "A lazy dog is sleeping"],
+        ]
+        predictions = [
+            "The quick brown fox jumps over the lazy dog",
+            "The lazy dog sleeps",
+        ]
+        bleu_score = Scorer.bleu_score_corpus(
+            list_of_references, predictions, "bleu4"
+        )
+        self.assertAlmostEqual(bleu_score, 1.0, places=2)
+
+    def test_bleu_score_corpus_single_prediction(self):
+        references = ["The quick brown fox jumps over the lazy dog"]
+        prediction = "The lazy cat"
+        bleu_score = Scorer.bleu_score_corpus(
+            [references], [prediction], "bleu1"
+        )
+        self.assertAlmostEqual(
+            bleu_score,
+            Scorer.sentence_bleu_score(references, prediction, "bleu1"),
+            places=6,
+        )
+
+    def test_sentence_bleu_score_invalid_bleu_type(self):
+        references = ["The quick brown fox jumps over the lazy dog"]
+        prediction = "The quick brown fox jumps over the lazy dog"
+        for bleu_type in ["bleu0", "bleu5", "rouge1"]:
+            with self.assertRaises(AssertionError):
+                Scorer.sentence_bleu_score(references, prediction, bleu_type)
+
+    def test_corpus_bleu_matches_nltk(self):
+        from nltk.translate.bleu_score import corpus_bleu, sentence_bleu
+        from deepeval.scorer.scorer import _BLEU_WEIGHT_MAP, _corpus_bleu
+
+        rng = random.Random(0)
+        vocabulary = ["the", "quick", "brown", "fox", "dog", "."]
+
+        def sentence(min_length):
+            length = rng.randint(min_length, 8)
+            return tuple(rng.choice(vocabulary) for _ in range(length))
+
+        # Short and empty hypotheses are checked on top of random ones.
+        cases = [
+            ([("the", "fox")], ()),
+            ([("the", "fox")], ("the",)),
+            ([("the", "quick", "fox"), ("a", "dog")], ("the", "dog")),
+        ] + [
+            ([sentence(1) for _ in range(rng.randint(1, 3))], sentence(0))
+            for _ in range(300)
+        ]
+        with warnings.catch_warnings():
+            # nltk warns about every hypothesis without a matching n-gram.
+            warnings.simplefilter("ignore")
+            for bleu_type in ["bleu1", "bleu2", "bleu3", "bleu4"]:
+                weights = _BLEU_WEIGHT_MAP[bleu_type]
+                for references, hypothesis in cases:
+                    self.assertAlmostEqual(
+                        _corpus_bleu(
+                            [tuple(references)], [hypothesis], weights
+                        ),
+                        sentence_bleu(references, hypothesis, weights),
+                        places=9,
+                    )
+                for start in range(0, len(cases), 10):
+                    corpus = cases[start : start + 10]
+                    self.assertAlmostEqual(
+                        _corpus_bleu(
+                            [tuple(references) for references, _ in corpus],
+                            [hypothesis for _, hypothesis in corpus],
+                            weights,
+                        ),
+                        corpus_bleu(
+                            [references for references, _ in corpus],
+                            [hypothesis for _, hypothesis in corpus],
+                            weights,
+                        ),
+                        places=9,
+                    )
+
+    def test_bleu_score_corpus_shared_references_match_nltk(self):
+        from nltk.translate.bleu_score import corpus_bleu
+        from deepeval.scorer.scorer import _BLEU_WEIGHT_MAP, _tokenize
+
+        # Shared references hit the cached n-gram counts, which must come
+        # out the same on every call.
+        references = [
+            "The quick brown fox jumps over the lazy dog",
+            "A quick brown dog jumps over the lazy fox",
+        ]
+        predictions = [
+            "The quick brown fox",
+            "The lazy dog jumps over the quick brown fox",
+            "A brown dog sleeps",
+            "",
+        ]
+        list_of_references = [references] * len(predictions)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for bleu_type, weights in _BLEU_WEIGHT_MAP.items():
+                expected = corpus_bleu(
+                    [
+                        [list(_tokenize(reference)) for reference in references]
+                        for references in list_of_references
+                    ],
+                    [list(_tokenize(prediction)) for prediction in predictions],
+                    weights,
+                )
+                for _ in range(2):
+                    self.assertAlmostEqual(
+                        Scorer.bleu_score_corpus(
+                            list_of_references, predictions, bleu_type
+                        ),
+                        expected,
+                        places=9,
+                    )
+
     # Adding tests for mismatch for rouge and sentence BLEU
 
     def test_rouge_score_mismatch(self):
@@ -166,6 +420,64 @@ class TestScorer(unittest.TestCase):
         self.assertIn("bert-recall", bert_scores)
         self.assertIn("bert-f1", bert_scores)
 
+    def test_bert_score_one(self):
+        references = ["The quick brown fox", "A fast brown fox"]
+        prediction = "The lazy dog"
+        with patch_bert_score_module():
+            bert_scores = Scorer.bert_score_one(references, prediction)
+        expected = stub_bert_score(prediction, references)
+        self.assertEqual(
+            bert_scores,
+            {
+                "bert-precision": expected,
+                "bert-recall": expected * 2,
+                "bert-f1": expected * 3,
+            },
+        )
+
+    def test_bert_score_mismatched_reference_lists(self):
+        with patch_bert_score_module():
+            with self.assertRaises(AssertionError):
+                Scorer.bert_score([["a", "b"]], ["x", "y", "z"])
+
+    def test_bert_score_chunks_keep_order_and_duplicates(self):
+        # 20 distinct pairs, each showing up twice.
+        references = [f"reference {i}" for i in range(20)] * 2
+        predictions = [f"prediction {i}" * (i % 3 + 1) for i in range(20)] * 2
+        expected = [
+            stub_bert_score(prediction, reference)
+            for prediction, reference in zip(predictions, references)
+        ]
+        for device, expected_calls in [("cpu", 1), ("cuda", 3)]:
+            StubBERTScorer.calls = []
+            with patch_bert_score_module():
+                with mock.patch(
+                    "deepeval.scorer.scorer._pick_device", return_value=device
+                ), mock.patch(
+                    "deepeval.scorer.scorer._inference_mode",
+                    lambda device: contextlib.nullcontext(),
+                ):
+                    bert_scores = Scorer.bert_score(
+                        references, predictions, batch_size=2
+                    )
+            # Distinct pairs are scored once, in chunks of 4 * batch_size on CUDA.
+            self.assertEqual(sum(StubBERTScorer.calls), 20)
+            self.assertEqual(len(StubBERTScorer.calls), expected_calls)
+            self.assertEqual(bert_scores["bert-precision"], expected)
+            self.assertEqual(
+                bert_scores["bert-f1"], [score * 3 for score in expected]
+            )
+
+    def test_bert_score_strings_and_empty_inputs(self):
+        with patch_bert_score_module():
+            bert_scores = Scorer.bert_score("reference", "prediction")
+            self.assertEqual(
+                bert_scores["bert-precision"],
+                [stub_bert_score("prediction", "reference")],
+            )
+            bert_scores = Scorer.bert_score([], [])
+            self.assertEqual(bert_scores["bert-f1"], [])
+
     # Tests for faithfulness score
 
     def test_faithfulness_score_identical_strings(self):
@@ -216,8 +528,98 @@ class TestScorer(unittest.TestCase):
         with self.assertRaises(AssertionError):
             Scorer.neural_toxic_score(prediction, model="invalid_model")
 
+    # Tests for factual consistency score
+
+    def test_factual_consistency_score_single_context(self):
+        from deepeval.models import FactualConsistencyModel
+
+        context = "Python is a programming language."
+        prediction = "Python is a language used to write programs."
+        score = Scorer.factual_consistency_score(context, prediction)
+        expected_score = FactualConsistencyModel().predict_batch(
+            [context], [prediction]
+        )[0]
+        self.assertTrue(0 <= score <= 1)
+        self.assertAlmostEqual(score, expected_score, places=4)
+
+    def test_factual_consistency_score_duplicate_contexts(self):
+        context = "Python is a programming language."
+        prediction = "Python is a language used to write programs."
+        self.assertAlmostEqual(
+            Scorer.factual_consistency_score([context] * 3, prediction),
+            Scorer.factual_consistency_score([context], prediction),
+            places=4,
+        )
+
+    def test_factual_consistency_score_without_early_stop(self):
+        from deepeval.models import FactualConsistencyModel
+
+        contexts = [
+            "Python is NOT a programming language.",
+            "The weather is nice today.",
+            "Python is a programming language.",
+        ]
+        prediction = "Python is a programming language."
+        score = Scorer.factual_consistency_score(
+            contexts, prediction, batch_size=1, early_stop_threshold=None
+        )
+        expected_scores = [
+            FactualConsistencyModel().predict_batch([context], [prediction])[0]
+            for context in contexts
+        ]
+        self.assertAlmostEqual(score, max(expected_scores), places=4)
+
+    def test_factual_consistency_score_early_stop(self):
+        contexts = [
+            "0.3 The weather is nice today.",
+            "0.5 Python is a language.",
+            "0.95 Python is a programming language.",
+            "1.0 Cats sleep a lot.",
+        ]
+        prediction = "Python is a programming language."
+        with patch_deepeval_models_module():
+            StubFactualConsistencyModel.calls = []
+            score = Scorer.factual_consistency_score(
+                contexts, prediction, batch_size=1, early_stop_threshold=0.9
+            )
+            # The context sharing the most words is scored first, and is
+            # the only one scored since it is over the threshold.
+            self.assertEqual(score, 0.95)
+            self.assertEqual(StubFactualConsistencyModel.calls, [[contexts[2]]])
+
+            StubFactualConsistencyModel.calls = []
+            score = Scorer.factual_consistency_score(
+                contexts, prediction, batch_size=1
+            )
+            self.assertEqual(score, 1.0)
+            self.assertEqual(
+                StubFactualConsistencyModel.calls,
+                [[context] for context in contexts],
+            )
+
     def test_hallucination_score(self):
         prediction = "A blond drinking water in public."
         source = "A man with blond-hair, and a brown shirt drinking out of a public water fountain."
         score = Scorer.hallucination_score(source, prediction)
         self.assertTrue(0 <= score <= 1)
+
+    def test_hallucination_score_batch(self):
+        predictions = [
+            "A blond drinking water in public.",
+            "A blond drinking water in public.",
+        ]
+        sources = [
+            "A man with blond-hair, and a brown shirt drinking out of a public water fountain.",
+            "Python is NOT a programming language.",
+        ]
+        scores = Scorer.hallucination_score_batch(sources, predictions)
+        self.assertEqual(len(scores), 2)
+        for source, prediction, score in zip(sources, predictions, scores):
+            self.assertAlmostEqual(
+                score,
+                Scorer.hallucination_score(source, prediction),
+                places=4,
+            )
+
+    def test_hallucination_score_batch_empty(self):
+        self.assertEqual(Scorer.hallucination_score_batch([], []), [])